@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: dict rows vs slotted records vs columnar batch.
+
+Usage (from the project root):
+  python scripts/benchmark_records.py            # 1,000,000 rows
+  python scripts/benchmark_records.py -n 200000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.core.contracts.records import Record, record  # noqa: E402
+from src.core.implementations.columnar import ColumnBatch  # noqa: E402
+
+
+@record
+class Reading(Record):
+    sensor_id: int
+    value: float
+    ok: bool
+
+
+def build_dicts(n: int):
+    return [{"sensor_id": i, "value": i * 0.5, "ok": i % 2 == 0} for i in range(n)]
+
+
+def build_records(n: int):
+    return [Reading(i, i * 0.5, i % 2 == 0) for i in range(n)]
+
+
+def build_batch(n: int):
+    # Public API on a generator: records are transient, only the columns stay alive
+    return ColumnBatch.from_records(Reading, (Reading(i, i * 0.5, i % 2 == 0) for i in range(n)))
+
+
+def measure(builder, n: int):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    obj = builder(n)
+    duration = time.perf_counter() - start
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return current, duration
+
+
+def parse_args(argv):
+    p = argparse.ArgumentParser(description="Record memory benchmark")
+    p.add_argument("-n", "--rows", type=int, default=1_000_000,
+                   help="Number of rows (default: 1,000,000)")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv or sys.argv[1:])
+    n = args.rows
+    per_million = 1_000_000 / n
+
+    print(f"Rows: {n:,}")
+    print(f"{'layout':<16}{'MiB / 1M rows':>16}{'bytes / row':>14}{'build (s)':>12}")
+    for label, builder in [
+        ("dict", build_dicts),
+        ("slotted record", build_records),
+        ("column batch", build_batch),
+    ]:
+        size, duration = measure(builder, n)
+        print(f"{label:<16}{size * per_million / 2**20:>16.1f}{size / n:>14.1f}{duration:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
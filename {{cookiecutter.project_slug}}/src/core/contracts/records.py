@@ -0,0 +1,75 @@
+"""
+Compact record contract for core domain objects.
+
+A dict per row costs a hash table per row (hundreds of bytes); a slotted
+dataclass stores its fields in fixed slots instead. Subclass `Record` and
+decorate with `@record` to get a slotted dataclass:
+
+    @record
+    class Reading(Record):
+        sensor_id: int
+        value: float
+        label: str = ""
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Iterable, Mapping, TypeVar, get_type_hints
+
+R = TypeVar("R", bound="Record")
+
+
+def record(cls=None, /, *, frozen: bool = False):
+    """
+    Turn a class into a slotted dataclass (no per-instance __dict__).
+    Usable as `@record` or `@record(frozen=True)`.
+    """
+    def wrap(klass):
+        return dataclass(klass, slots=True, frozen=frozen)
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+class Record:
+    """
+    Base class for slotted domain records.
+    Declares empty __slots__ so subclasses built with `@record` stay dict-free.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def field_names(cls) -> tuple[str, ...]:
+        """Field names in declaration order."""
+        return tuple(f.name for f in fields(cls))
+
+    @classmethod
+    def field_types(cls) -> dict[str, Any]:
+        """Resolved field annotations (handles `from __future__ import annotations`)."""
+        hints = get_type_hints(cls)
+        return {name: hints[name] for name in cls.field_names()}
+
+    @classmethod
+    def from_dict(cls: type[R], data: Mapping[str, Any]) -> R:
+        """
+        Build a record from a mapping (e.g. a parsed JSON row).
+        Unknown keys are rejected so typos do not pass silently.
+        """
+        names = cls.field_names()
+        unknown = set(data) - set(names)
+        if unknown:
+            raise ValueError(f"unknown fields for {cls.__name__}: {sorted(unknown)}")
+        return cls(**data)
+
+    @classmethod
+    def from_rows(cls: type[R], rows: Iterable[Mapping[str, Any]]) -> list[R]:
+        """Convert an iterable of dict rows into records."""
+        return [cls.from_dict(row) for row in rows]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Shallow dict view (unlike dataclasses.asdict, no recursive deepcopy)."""
+        return {name: getattr(self, name) for name in self.field_names()}
+
+    def to_tuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.field_names())
@@ -0,0 +1,126 @@
+"""
+Columnar batch container for `Record` types.
+
+Numeric fields (int, float, bool) are stored in `array.array` columns, so
+a million rows cost 8 bytes per value instead of one Python object each.
+Other fields fall back to plain lists. NumPy/pandas conversion reuses the
+array buffers (zero-copy) and is only imported when requested.
+"""
+
+from array import array
+from typing import Any, Generic, Iterable, Iterator, TypeVar
+
+from src.core.contracts.records import Record
+
+R = TypeVar("R", bound=Record)
+
+# Python annotation -> (array typecode, numpy dtype)
+TYPECODES = {
+    int: ("q", "int64"),
+    float: ("d", "float64"),
+    bool: ("b", "bool"),
+}
+TYPECODES_BY_CODE = {code: dtype for code, dtype in TYPECODES.values()}
+
+
+class ColumnBatch(Generic[R]):
+    """
+    Column-oriented storage for records of a single `Record` type.
+
+    Note: while a NumPy view returned by `to_numpy()` is alive, the
+    underlying arrays cannot grow; `append()` then raises BufferError.
+    """
+
+    def __init__(self, record_type: type[R]):
+        if not (isinstance(record_type, type) and issubclass(record_type, Record)):
+            raise TypeError("record_type must be a Record subclass")
+        self.record_type = record_type
+        self.names = record_type.field_names()
+        self.columns: dict[str, Any] = {}
+        self.bools: set[str] = set()
+        for name, tp in record_type.field_types().items():
+            spec = TYPECODES.get(tp)
+            self.columns[name] = array(spec[0]) if spec else []
+            if tp is bool:
+                self.bools.add(name)
+
+    @classmethod
+    def from_records(cls, record_type: type[R], records: Iterable[R]) -> "ColumnBatch[R]":
+        batch = cls(record_type)
+        batch.extend(records)
+        return batch
+
+    def append(self, rec: R) -> None:
+        if not isinstance(rec, self.record_type):
+            raise TypeError(f"expected {self.record_type.__name__}, got {type(rec).__name__}")
+        done = []
+        try:
+            for name in self.names:
+                value = getattr(rec, name)
+                # Keep bool columns strictly 0/1 so NumPy bool views stay well-defined
+                self.columns[name].append(bool(value) if name in self.bools else value)
+                done.append(name)
+        except Exception:
+            # Roll back so a bad value (or a BufferError) cannot misalign the columns
+            for name in done:
+                self.columns[name].pop()
+            raise
+
+    def extend(self, records: Iterable[R]) -> None:
+        for rec in records:
+            self.append(rec)
+
+    def __len__(self) -> int:
+        if not self.names:
+            return 0
+        return len(self.columns[self.names[0]])
+
+    def __getitem__(self, index: int) -> R:
+        """Materialize a single row back into a record."""
+        values = []
+        for name in self.names:
+            value = self.columns[name][index]
+            values.append(bool(value) if name in self.bools else value)
+        return self.record_type(*values)
+
+    def __iter__(self) -> Iterator[R]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, name: str):
+        """Raw column storage (array.array or list)."""
+        if name not in self.columns:
+            raise KeyError(f"unknown column: {name}")
+        return self.columns[name]
+
+    def nbytes(self) -> int:
+        """Bytes held by the array-backed columns (list columns excluded)."""
+        return sum(
+            col.itemsize * len(col) for col in self.columns.values() if isinstance(col, array)
+        )
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        Map column name -> numpy array.
+        Array-backed columns are zero-copy views; list columns become object arrays.
+        """
+        import numpy as np
+
+        out = {}
+        for name, col in self.columns.items():
+            if isinstance(col, array):
+                dtype = TYPECODES_BY_CODE[col.typecode]
+                out[name] = np.frombuffer(col, dtype=dtype) if len(col) else np.empty(0, dtype=dtype)
+            else:
+                out[name] = np.array(col, dtype=object)
+        return out
+
+    def to_pandas(self):
+        """
+        Build a DataFrame from the numpy columns.
+        copy=False lets pandas keep the views; it may still consolidate blocks.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.to_numpy(), columns=list(self.names), copy=False)
+
@@ -0,0 +1,229 @@
+"""
+Workspace cleanup: one os.scandir pass, parallel deletion, retention policies.
+
+Always removed:
+  - bytecode caches and tool caches (__pycache__, .ipynb_checkpoints,
+    .pytest_cache, .mypy_cache, .ruff_cache, .tox, ...)
+  - stray *.pyc / *.pyo files
+
+Retention (only when a policy is given):
+  - files under outputs/ and .cache/ older than `max_age_days`
+  - oldest files under each of those roots until it fits in `max_size_mb`
+  - directories emptied by those deletions (pre-existing empty ones stay)
+
+Memoization caches are expected under .cache/ (e.g. joblib.Memory(".cache"));
+caches stored elsewhere (home directory, custom paths) are out of scope.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+JUNK_DIRS = {
+    "__pycache__", ".ipynb_checkpoints", ".pytest_cache", ".hypothesis", "htmlcov",
+    ".mypy_cache", ".ruff_cache", ".tox",
+}
+JUNK_SUFFIXES = (".pyc", ".pyo")
+RETAINED_DIRS = ("outputs", ".cache")
+SKIP_DIRS = {".git", ".venv", "venv", "env", "node_modules"}
+KEEP_FILES = {".gitkeep"}
+
+
+@dataclass
+class CleanReport:
+    removed: int = 0
+    bytes_reclaimed: int = 0
+    seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+
+def tree_size(path: str) -> int:
+    """Total size of regular files below `path` (symlinks not followed)."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
+def remove_tree(path: str) -> int:
+    """Delete a directory tree in a single pass, returning the bytes freed."""
+    freed = 0
+    dirs = [path]
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            entries = list(it)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.path)
+                stack.append(entry.path)
+            else:
+                size = entry.stat(follow_symlinks=False).st_size
+                os.unlink(entry.path)
+                freed += size
+    # Parents were collected before children: remove deepest first
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+    return freed
+
+
+def scan(root: str = ".") -> tuple[list[tuple[str, int, bool]], dict[str, list[tuple[str, int, float]]]]:
+    """
+    Walk `root` once.
+
+    Returns:
+      junk     -> [(path, size, is_dir)] to remove unconditionally
+                  (size is 0 for directories until they are removed)
+      retained -> {retained_root: [(path, size, mtime)]} retention candidates
+    """
+    junk = []
+    retained: dict[str, list[tuple[str, int, float]]] = {}
+    # (directory, retained root it belongs to or None)
+    stack = [(root, None)]
+    while stack:
+        current, bucket = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in SKIP_DIRS:
+                    continue
+                if entry.name in JUNK_DIRS:
+                    # Size is summed by the worker that deletes it; never descend here
+                    junk.append((entry.path, 0, True))
+                    continue
+                child_bucket = bucket
+                if bucket is None and current == root and entry.name in RETAINED_DIRS:
+                    child_bucket = entry.path
+                    retained.setdefault(child_bucket, [])
+                stack.append((entry.path, child_bucket))
+                continue
+            if entry.name in KEEP_FILES:
+                continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if entry.name.endswith(JUNK_SUFFIXES):
+                junk.append((entry.path, st.st_size, False))
+            elif bucket is not None:
+                retained[bucket].append((entry.path, st.st_size, st.st_mtime))
+    return junk, retained
+
+
+def apply_retention(
+    files: list[tuple[str, int, float]],
+    max_age_days: float = 0,
+    max_size_mb: float = 0,
+    now: float | None = None,
+) -> list[tuple[str, int, bool]]:
+    """
+    Pick files to drop: first anything older than `max_age_days`, then the
+    oldest remaining files until the total fits in `max_size_mb`.
+    A value of 0 disables the corresponding policy.
+    """
+    now = time.time() if now is None else now
+    doomed = []
+    kept = []
+    cutoff = now - max_age_days * 86400
+    for path, size, mtime in files:
+        if max_age_days and mtime < cutoff:
+            doomed.append((path, size, False))
+        else:
+            kept.append((path, size, mtime))
+
+    if max_size_mb:
+        budget = max_size_mb * 2**20
+        total = sum(size for _, size, _ in kept)
+        for path, size, _ in sorted(kept, key=lambda f: f[2]):
+            if total <= budget:
+                break
+            doomed.append((path, size, False))
+            total -= size
+    return doomed
+
+
+def remove(target: tuple[str, int, bool], dry_run: bool = False) -> tuple[int, str | None]:
+    """
+    Delete a file or directory (or just size it when `dry_run`).
+    Returns (bytes freed, error message) instead of raising.
+    """
+    path, size, is_dir = target
+    try:
+        if dry_run:
+            return (tree_size(path) if is_dir else size), None
+        if is_dir:
+            return remove_tree(path), None
+        os.unlink(path)
+        return size, None
+    except FileNotFoundError:
+        return 0, None
+    except OSError as err:
+        return 0, f"{path}: {err}"
+
+
+def prune_empty_parents(paths: list[str], roots: list[str]) -> None:
+    """
+    Walk up from the parents of deleted files towards their retained root,
+    removing directories that are now empty; stop at the first non-empty one.
+    The retained root itself is never removed, and .gitkeep keeps a dir alive.
+    """
+    stops = {os.path.abspath(root) for root in roots}
+    for parent in sorted({os.path.dirname(os.path.abspath(p)) for p in paths}, key=len, reverse=True):
+        current = parent
+        while current not in stops and os.path.dirname(current) != current:
+            try:
+                if os.listdir(current):
+                    break
+                os.rmdir(current)
+            except OSError:
+                break
+            current = os.path.dirname(current)
+
+
+def clean_workspace(
+    root: str | Path = ".",
+    max_age_days: float = 0,
+    max_size_mb: float = 0,
+    workers: int = 8,
+    dry_run: bool = False,
+) -> CleanReport:
+    start = time.perf_counter()
+    junk, retained = scan(str(root))
+    targets = list(junk)
+    expired = []
+    if max_age_days or max_size_mb:
+        for files in retained.values():
+            expired.extend(apply_retention(files, max_age_days, max_size_mb))
+    targets.extend(expired)
+
+    report = CleanReport()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(lambda t: remove(t, dry_run), targets))
+
+    for freed, error in results:
+        if error:
+            report.errors.append(error)
+        else:
+            report.removed += 1
+            report.bytes_reclaimed += freed
+
+    if expired and not dry_run:
+        removed = [t[0] for t, (_, error) in zip(expired, results[len(junk):]) if not error]
+        prune_empty_parents(removed, list(retained))
+    report.seconds = time.perf_counter() - start
+    return report
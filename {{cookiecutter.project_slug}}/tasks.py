@@ -1,14 +1,26 @@
 from invoke import task
 
-@task
-def clean(c):
+from src.utils.cleanup import clean_workspace
+
+@task(help={
+    "max_age": "Drop files in outputs/ and .cache/ older than N days (0 = keep)",
+    "max_size": "Trim outputs/ and .cache/ to N MB each, oldest first (0 = no limit)",
+    "workers": "Parallel delete threads (default: 8)",
+    "dry": "Only report what would be removed",
+})
+def clean(c, max_age=0.0, max_size=0.0, workers=8, dry=False):
     """
-    Clean temporary files and folders (e.g. __pycache__, *.pyc).
+    Clean temporary files and folders (e.g. __pycache__, *.pyc, checkpoints),
+    optionally applying age/size retention to outputs/ and caches.
     """
-    print("Cleaning project...")  # You can use c.run() here
-    # Example:
-    # c.run("find . -type d -name '__pycache__' -exec rm -r {} +")
-    # c.run("find . -type f -name '*.pyc' -delete")
+    print("Cleaning project...")
+    report = clean_workspace(".", max_age_days=max_age, max_size_mb=max_size,
+                             workers=workers, dry_run=dry)
+    verb = "Would remove" if dry else "Removed"
+    print(f"{verb} {report.removed} item(s), {report.bytes_reclaimed / 2**20:.1f} MB "
+          f"in {report.seconds:.2f}s")
+    for error in report.errors:
+        print(f" Failed to remove {error}")
 
 @task
 def test(c):
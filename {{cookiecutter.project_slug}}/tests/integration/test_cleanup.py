@@ -0,0 +1,105 @@
+"""
+Integration tests for workspace cleanup (real temp directories).
+
+  src/utils/cleanup.py -> clean_workspace(), apply_retention()
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.utils.cleanup import apply_retention, clean_workspace  # noqa: E402
+
+
+def write(path: Path, size: int, age_days: float = 0) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    if age_days:
+        stamp = time.time() - age_days * 86400
+        os.utime(path, (stamp, stamp))
+    return path
+
+
+class TestCleanup(unittest.TestCase):
+
+    def test___clean_workspace___bytecode_and_checkpoints____removed_and_counted(self):
+        # ARRANGE
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            write(td / "src" / "__pycache__" / "a.cpython-312.pyc", 100)
+            write(td / "notebooks" / ".ipynb_checkpoints" / "nb-checkpoint.ipynb", 50)
+            write(td / "stray.pyc", 10)
+            write(td / ".mypy_cache" / "3.12" / "cache.json", 40)
+            keep = write(td / "src" / "a.py", 5)
+            write(td / ".git" / "__pycache__" / "ignored.pyc", 7)
+
+            # ACT
+            report = clean_workspace(td, workers=2)
+
+            # ASSERT
+            self.assertEqual(report.errors, [])
+            self.assertEqual(report.removed, 4)
+            self.assertEqual(report.bytes_reclaimed, 200)
+            self.assertFalse((td / ".mypy_cache").exists())
+            self.assertFalse((td / "src" / "__pycache__").exists())
+            self.assertFalse((td / "notebooks" / ".ipynb_checkpoints").exists())
+            self.assertTrue(keep.exists())
+            self.assertTrue((td / ".git" / "__pycache__").exists(), ".git must not be walked")
+
+    def test___clean_workspace___no_policy____outputs_untouched(self):
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            report_file = write(td / "outputs" / "reports" / "old.html", 10, age_days=90)
+
+            report = clean_workspace(td)
+
+            self.assertEqual(report.removed, 0)
+            self.assertTrue(report_file.exists())
+
+    def test___clean_workspace___max_age____drops_stale_outputs_keeps_gitkeep(self):
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            stale = write(td / "outputs" / "reports" / "old.html", 10, age_days=90)
+            fresh = write(td / "outputs" / "reports" / "new.html", 10)
+            gitkeep = write(td / "outputs" / ".gitkeep", 0, age_days=90)
+            dated = write(td / "outputs" / "runs" / "2024-01-01" / "plot.png", 5, age_days=90)
+            kept_dir = write(td / "outputs" / "visualization" / ".gitkeep", 0, age_days=90).parent
+            user_dir = td / "outputs" / "empty_user_dir"
+            user_dir.mkdir()
+
+            report = clean_workspace(td, max_age_days=30)
+
+            self.assertFalse(stale.exists())
+            self.assertTrue(fresh.exists())
+            self.assertTrue(gitkeep.exists())
+            self.assertFalse(dated.parent.parent.exists(), "emptied dated folders must be pruned")
+            self.assertTrue(kept_dir.exists(), "folders holding a .gitkeep must stay")
+            self.assertTrue(user_dir.exists(), "pre-existing empty folders are not retention's to prune")
+            self.assertEqual(report.bytes_reclaimed, 15)
+
+    def test___clean_workspace___dry_run____reports_without_deleting(self):
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            pyc = write(td / "__pycache__" / "m.pyc", 20)
+
+            report = clean_workspace(td, dry_run=True)
+
+            self.assertEqual(report.bytes_reclaimed, 20)
+            self.assertTrue(pyc.exists())
+
+    def test___apply_retention___over_size_budget____drops_oldest_first(self):
+        mb = 2**20
+        files = [("new", mb, 300.0), ("old", mb, 100.0), ("mid", mb, 200.0)]
+
+        doomed = apply_retention(files, max_size_mb=2, now=400.0)
+
+        self.assertEqual([path for path, _, _ in doomed], ["old"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
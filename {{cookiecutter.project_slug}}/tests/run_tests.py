@@ -9,13 +9,21 @@ Covers:
 Features:
   - Discovery across both roots
   - Filename pattern filtering (e.g., test_*.py)
+  - Test id filtering with -k (substring or wildcard, like unittest -k)
+  - Persistent discovery index: targeted runs import only matching modules
   - Verbosity, failfast, buffer
   - Optional randomized order with seed
   - Compact summary
 """
 
 import argparse
+import fnmatch
+import hashlib
+import importlib
+import json
+import os
 import random
+import re
 import sys
 import time
 import unittest
@@ -27,6 +35,12 @@ DEFAULT_ROOTS = [
     Path("tests") / "integration",
 ]
 
+# Discovery index (test ids per module, keyed by file mtime/size)
+INDEX_PATH = Path(".cache") / "test_index.json"
+
+# Same check unittest discovery applies to candidate file names
+VALID_MODULE_NAME = re.compile(r"[_a-z]\w*\.py$", re.IGNORECASE)
+
 
 def flatten_suite(suite: unittest.TestSuite):
     for item in suite:
@@ -44,19 +58,201 @@ def shuffle_suite(suite: unittest.TestSuite, seed: int | None) -> unittest.TestS
     return unittest.TestSuite(tests)
 
 
-def discover_from_roots(pattern: str, roots: list[Path]) -> unittest.TestSuite:
-    loader = unittest.defaultTestLoader
-    discovered = []
-    for root in roots:
-        if root.exists():
-            discovered.append(loader.discover(start_dir=str(root), pattern=pattern))
+def match_keywords(test_id: str, keywords: list[str]) -> bool:
+    """unittest -k semantics: substring match, or fnmatch when the pattern has '*'."""
+    if not keywords:
+        return True
+    return any(
+        fnmatch.fnmatchcase(test_id, kw if "*" in kw else f"*{kw}*")
+        for kw in keywords
+    )
+
+
+def iter_test_files(root: Path, pattern: str):
+    """
+    Yield (file, module_name) below root without importing anything.
+    Mirrors unittest discovery: only recurse into packages (dirs with __init__.py).
+    """
+    stack = [(root, "")]
+    while stack:
+        current, prefix = stack.pop()
+        try:
+            entries = sorted(os.scandir(current), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir():
+                if (Path(entry.path) / "__init__.py").exists():
+                    stack.append((Path(entry.path), f"{prefix}{entry.name}."))
+            elif VALID_MODULE_NAME.match(entry.name) and fnmatch.fnmatch(entry.name, pattern):
+                yield Path(entry.path), prefix + entry.name[:-3]
+
+
+def support_stamp(root: Path, test_files: list[Path]) -> str:
+    """
+    Combined mtime/size stamp of every non-test .py file below root.
+    Test ids also depend on helpers/base classes the test modules import.
+    """
+    skip = {str(f) for f in test_files}
+    parts = []
+    for current, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            path = os.path.join(current, name)
+            if name.endswith(".py") and path not in skip:
+                st = os.stat(path)
+                parts.append(f"{path}:{st.st_mtime_ns}:{st.st_size}")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def failed_import_test(module_name: str, err: Exception) -> unittest.TestCase:
+    def test_import():
+        raise ImportError(f"Failed to import test module: {module_name}\n{err!r}")
+    return unittest.FunctionTestCase(test_import, description=f"import {module_name}")
+
+
+class DiscoveryIndex:
+    """
+    Persistent map: test file -> module name + test ids, keyed by mtime/size.
+    Each root also stores a stamp of its non-test modules; when that changes,
+    the root's entries are dropped. Unchanged files are answered from the
+    index without importing them.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.roots: dict[str, str] = {}
+        self.dirty = False
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if data.get("version") == self.VERSION:
+                    self.entries = data["files"]
+                    self.roots = data["roots"]
+            except (OSError, ValueError, KeyError):
+                self.entries, self.roots = {}, {}
+
+    def check_root(self, root: Path, stamp: str) -> None:
+        """Invalidate every entry under root if its support modules changed."""
+        if self.roots.get(str(root)) == stamp:
+            return
+        prefix = str(root) + os.sep
+        self.entries = {k: v for k, v in self.entries.items() if not k.startswith(prefix)}
+        self.roots[str(root)] = stamp
+        self.dirty = True
+
+    @staticmethod
+    def stamp(file: Path) -> list[int]:
+        st = file.stat()
+        return [st.st_mtime_ns, st.st_size]
+
+    def lookup(self, file: Path, module_name: str) -> list[str] | None:
+        entry = self.entries.get(str(file))
+        if entry and entry["module"] == module_name and entry["stamp"] == self.stamp(file):
+            return entry["tests"]
+        return None
+
+    def store(self, file: Path, module_name: str, test_ids: list[str]) -> None:
+        self.entries[str(file)] = {
+            "module": module_name,
+            "stamp": self.stamp(file),
+            "tests": test_ids,
+        }
+        self.dirty = True
+
+    def save(self) -> None:
+        stale = [key for key in self.entries if not Path(key).exists()]
+        for key in stale:
+            del self.entries[key]
+        if self.path is None or not (self.dirty or stale):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": self.VERSION, "roots": self.roots, "files": self.entries}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def load_module_tests(root: Path, file: Path, module_name: str):
+    """Import one test module (with root as top-level dir) and return its flat test list."""
+    top = str(root.resolve())
+    if top not in sys.path:
+        sys.path.insert(0, top)
+    try:
+        module = importlib.import_module(module_name)
+    except Exception as err:  # surface as a failing test, like unittest discovery
+        return None, [failed_import_test(module_name, err)]
+    # Same-named modules under different roots resolve to whichever was imported
+    # first; fail loudly instead of silently running the wrong file.
+    module_file = getattr(module, "__file__", None)
+    if module_file is None or Path(module_file).resolve() != file.resolve():
+        err = ImportError(
+            f"{module_name!r} module incorrectly imported from {module_file!r}. "
+            f"Expected {str(file)!r}. Is this module name duplicated across test roots?"
+        )
+        return None, [failed_import_test(module_name, err)]
+    tests = list(flatten_suite(unittest.defaultTestLoader.loadTestsFromModule(module)))
+    return module, tests
+
+
+def discover_from_roots(
+    pattern: str,
+    roots: list[Path],
+    keywords: list[str] | None = None,
+    index_path: Path | None = INDEX_PATH,
+    stats: dict | None = None,
+) -> unittest.TestSuite:
+    """
+    Collect tests from roots, importing only the modules that may contain
+    tests matching `keywords` (or whose index entry is missing/stale).
+    """
+    keywords = keywords or []
+    existing = [root for root in roots if root.exists()]
     # Fallback: discover from tests/ if specific roots missing
-    if not discovered and Path("tests").exists():
-        discovered.append(loader.discover(start_dir="tests", pattern=pattern))
+    if not existing and Path("tests").exists():
+        existing = [Path("tests")]
     # Last resort: current directory
-    if not discovered:
-        discovered.append(loader.discover(start_dir=".", pattern=pattern))
-    return unittest.TestSuite(discovered)
+    if not existing:
+        existing = [Path(".")]
+
+    index = DiscoveryIndex(index_path)
+    selected = []
+    skipped = []
+    seen = imported = 0
+
+    def load(root, file, module_name):
+        nonlocal imported
+        module, tests = load_module_tests(root, file, module_name)
+        imported += 1
+        if module is not None:
+            index.store(file, module_name, [t.id() for t in tests])
+            tests = [t for t in tests if match_keywords(t.id(), keywords)]
+        selected.extend(tests)
+
+    for root in existing:
+        files = list(iter_test_files(root, pattern))
+        index.check_root(root, support_stamp(root, [f for f, _ in files]))
+        for file, module_name in files:
+            seen += 1
+            cached = index.lookup(file, module_name)
+            if cached is not None and not any(match_keywords(t, keywords) for t in cached):
+                skipped.append((root, file, module_name))
+                continue
+            load(root, file, module_name)
+
+    # An empty selection may hide ids the index cannot see (e.g. code outside
+    # the roots changed); confirm by importing the skipped modules before
+    # reporting nothing to run.
+    if not selected:
+        for root, file, module_name in skipped:
+            load(root, file, module_name)
+    index.save()
+
+    if stats is not None:
+        stats.update(modules=seen, imported=imported)
+    return unittest.TestSuite(selected)
 
 
 def parse_args(argv):
@@ -65,6 +261,10 @@ def parse_args(argv):
                    help="Subset to run (default: all)")
     p.add_argument("--pattern", default="test_*.py",
                    help='Filename pattern (default: "test_*.py")')
+    p.add_argument("-k", dest="keywords", action="append", default=[],
+                   help="Only run tests whose id matches (substring or *glob*); repeatable")
+    p.add_argument("--no-cache", action="store_true",
+                   help=f"Ignore and do not update the discovery index ({INDEX_PATH})")
     p.add_argument("--verbosity", "-v", type=int, default=2,
                    help="Verbosity for TextTestRunner (default: 2)")
     p.add_argument("--failfast", action="store_true",
@@ -86,7 +286,14 @@ def main(argv=None):
     else:
         roots = DEFAULT_ROOTS
 
-    suite = discover_from_roots(pattern=args.pattern, roots=roots)
+    stats = {}
+    suite = discover_from_roots(
+        pattern=args.pattern,
+        roots=roots,
+        keywords=args.keywords,
+        index_path=None if args.no_cache else INDEX_PATH,
+        stats=stats,
+    )
     suite = shuffle_suite(suite, seed=args.seed)
 
     runner = unittest.TextTestRunner(
@@ -110,6 +317,8 @@ def main(argv=None):
     print(f"  Suite:        {args.suite}")
     print(f"  Roots:        {', '.join(str(p) for p in roots)}")
     print(f"  Pattern:      {args.pattern}")
+    print(f"  Filter:       {' | '.join(args.keywords) if args.keywords else '-'}")
+    print(f"  Imported:     {stats['imported']}/{stats['modules']} module(s)")
     print(f"  Seed:         {args.seed if args.seed is not None else '-'}")
     print(f"  Ran:          {total} test(s) in {duration:.2f}s")
     print(f"  Failures:     {failed}")
@@ -0,0 +1,105 @@
+"""
+Unit tests for slotted records and the columnar batch.
+
+  src/core/contracts/records.py         -> Record, record
+  src/core/implementations/columnar.py  -> ColumnBatch
+"""
+
+import sys
+import unittest
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.core.contracts.records import Record, record  # noqa: E402
+from src.core.implementations.columnar import ColumnBatch  # noqa: E402
+
+
+@record
+class Reading(Record):
+    sensor_id: int
+    value: float
+    ok: bool
+    label: str = ""
+
+
+class TestRecord(unittest.TestCase):
+
+    def test___record___instance____has_no_dict(self):
+        rec = Reading(1, 2.5, True)
+        self.assertFalse(hasattr(rec, "__dict__"))
+        with self.assertRaises(AttributeError):
+            rec.extra = 1
+
+    def test___from_dict___valid_row____round_trips_with_to_dict(self):
+        row = {"sensor_id": 1, "value": 2.5, "ok": True, "label": "a"}
+        rec = Reading.from_dict(row)
+        self.assertEqual(rec.to_dict(), row)
+        self.assertEqual(rec.to_tuple(), (1, 2.5, True, "a"))
+
+    def test___from_dict___unknown_key____raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Reading.from_dict({"sensor_id": 1, "value": 2.5, "ok": True, "typo": 0})
+
+
+class TestColumnBatch(unittest.TestCase):
+
+    def test___from_records___numeric_fields____stored_in_arrays(self):
+        batch = ColumnBatch.from_records(Reading, [Reading(1, 0.5, True, "x"), Reading(2, 1.5, False)])
+        self.assertEqual(len(batch), 2)
+        self.assertIsInstance(batch.column("sensor_id"), array)
+        self.assertIsInstance(batch.column("label"), list)
+        self.assertEqual(batch.nbytes(), 2 * (8 + 8 + 1))
+
+    def test___getitem___stored_row____returns_equal_record(self):
+        rows = [Reading(1, 0.5, True, "x"), Reading(2, 1.5, False)]
+        batch = ColumnBatch.from_records(Reading, rows)
+        self.assertEqual(list(batch), rows)
+        self.assertIs(batch[0].ok, True)
+
+    def test___append___wrong_type____raises_type_error(self):
+        batch = ColumnBatch(Reading)
+        with self.assertRaises(TypeError):
+            batch.append({"sensor_id": 1})
+
+    def test___append___bad_value_midway____rolls_back_partial_row(self):
+        batch = ColumnBatch.from_records(Reading, [Reading(1, 0.5, True)])
+        with self.assertRaises(TypeError):
+            batch.append(Reading(2, None, False))
+        self.assertEqual(len(batch), 1)
+        self.assertEqual(len(batch.column("sensor_id")), 1)
+        self.assertEqual(list(batch), [Reading(1, 0.5, True)])
+
+    def test___append___truthy_non_bool_in_bool_field____stored_as_0_or_1(self):
+        batch = ColumnBatch.from_records(Reading, [Reading(1, 0.5, 5), Reading(2, 1.5, 0)])
+        self.assertEqual(list(batch.column("ok")), [1, 0])
+
+    def test___to_numpy___array_columns____share_memory(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy not installed")
+        batch = ColumnBatch.from_records(Reading, [Reading(i, i * 0.5, True) for i in range(3)])
+        cols = batch.to_numpy()
+        self.assertEqual(cols["value"].dtype, np.float64)
+        batch.column("value")[0] = 9.0
+        self.assertEqual(cols["value"][0], 9.0)
+
+    def test___to_pandas___numeric_columns____are_views_and_block_append(self):
+        try:
+            import numpy as np
+            import pandas  # noqa: F401
+        except ImportError:
+            self.skipTest("pandas not installed")
+        batch = ColumnBatch.from_records(Reading, [Reading(i, i * 0.5, True) for i in range(3)])
+        df = batch.to_pandas()
+        self.assertTrue(np.shares_memory(df["value"].to_numpy(), np.frombuffer(batch.column("value"))))
+        # While the view is alive the arrays cannot grow, and the row is rolled back
+        with self.assertRaises(BufferError):
+            batch.append(Reading(3, 1.5, False))
+        self.assertEqual(len(batch), 3)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
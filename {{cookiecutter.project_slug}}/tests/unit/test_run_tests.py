@@ -0,0 +1,157 @@
+"""
+Unit tests for the cached discovery in tests/run_tests.py.
+
+  tests/run_tests.py -> match_keywords(), DiscoveryIndex, discover_from_roots()
+"""
+
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import run_tests  # noqa: E402
+
+
+class TestKeywords(unittest.TestCase):
+
+    def test___match_keywords___table_of_patterns____unittest_k_semantics(self):
+        test_id = "test_mod.TestLogic.test___sanitize_ids___none_input"
+        cases = [
+            ([], True),
+            (["sanitize"], True),
+            (["Sanitize"], False),
+            (["*TestLogic.test_*none*"], True),
+            (["nothing", "none_input"], True),
+            (["test_mod.TestTimebox*"], False),
+        ]
+        for keywords, expected in cases:
+            with self.subTest(keywords=keywords):
+                self.assertEqual(run_tests.match_keywords(test_id, keywords), expected)
+
+
+def write_test_module(root: Path, name: str, class_name: str = "Case") -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    (root / f"{name}.py").write_text(textwrap.dedent(f"""
+        import unittest
+        class {class_name}(unittest.TestCase):
+            def test_{name}(self):
+                pass
+    """), encoding="utf-8")
+
+
+class TestDiscoveryIndex(unittest.TestCase):
+
+    def forget_imports(self, roots: list[Path], names: list[str]) -> None:
+        """Undo sys.path/sys.modules side effects of discovery, even if asserts fail."""
+        for root in roots:
+            top = str(root.resolve())
+            self.addCleanup(lambda top=top: top in sys.path and sys.path.remove(top))
+        for name in names:
+            self.addCleanup(sys.modules.pop, name, None)
+
+    def test___discover_from_roots___cached_non_matching_module____not_imported(self):
+        # ARRANGE — two modules; index them once with an unfiltered run
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            root = td / "idx_root"
+            names = ["test_idx_alpha", "test_idx_beta"]
+            for name in names:
+                write_test_module(root, name)
+            index_path = td / "index.json"
+            run_tests.discover_from_roots("test_*.py", [root], index_path=index_path)
+            self.forget_imports([root], names)
+            for name in names:
+                sys.modules.pop(name, None)
+
+            # ACT — filtered run should only import the matching module
+            stats = {}
+            suite = run_tests.discover_from_roots(
+                "test_*.py", [root], keywords=["beta"], index_path=index_path, stats=stats
+            )
+
+            # ASSERT
+            self.assertEqual([t.id() for t in suite], ["test_idx_beta.Case.test_test_idx_beta"])
+            self.assertEqual(stats, {"modules": 2, "imported": 1})
+            self.assertNotIn("test_idx_alpha", sys.modules)
+
+    def test___discover_from_roots___same_module_name_in_two_roots____reports_import_error(self):
+        # ARRANGE — identical module names under two roots (e.g. unit/ and integration/)
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            unit, integration = td / "unit", td / "integration"
+            write_test_module(unit, "test_idx_dup", "UnitCase")
+            write_test_module(integration, "test_idx_dup", "IntegrationCase")
+            index_path = td / "index.json"
+
+            # ACT
+            suite = run_tests.discover_from_roots("test_*.py", [unit, integration], index_path=index_path)
+            self.forget_imports([unit, integration], ["test_idx_dup"])
+            result = unittest.TestResult()
+            suite.run(result)
+
+            # ASSERT — the shadowed file fails loudly and is not indexed with the wrong ids
+            self.assertEqual(result.testsRun, 2)
+            self.assertEqual(len(result.errors), 1)
+            self.assertIn("incorrectly imported", result.errors[0][1])
+            index = run_tests.DiscoveryIndex(index_path)
+            self.assertIsNone(index.lookup(integration / "test_idx_dup.py", "test_idx_dup"))
+
+    def test___discover_from_roots___base_class_helper_changed____new_test_selected(self):
+        # ARRANGE — test module inherits its tests from a non-test helper module
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            root = td / "idx_base_root"
+            root.mkdir()
+            helper = root / "idx_base_cases.py"
+            helper.write_text(textwrap.dedent("""
+                import unittest
+                class Base(unittest.TestCase):
+                    def test_one(self):
+                        pass
+            """), encoding="utf-8")
+            (root / "test_idx_inherits.py").write_text(textwrap.dedent("""
+                import idx_base_cases
+                class Case(idx_base_cases.Base):
+                    pass
+            """), encoding="utf-8")
+            index_path = td / "index.json"
+            run_tests.discover_from_roots("test_*.py", [root], index_path=index_path)
+            names = ["idx_base_cases", "test_idx_inherits"]
+            self.forget_imports([root], names)
+            for name in names:
+                sys.modules.pop(name, None)
+
+            # ACT — add a test to the helper only, then filter on it
+            helper.write_text(textwrap.dedent("""
+                import unittest
+                class Base(unittest.TestCase):
+                    def test_one(self):
+                        pass
+                    def test_two(self):
+                        pass
+            """), encoding="utf-8")
+            stats = {}
+            suite = run_tests.discover_from_roots(
+                "test_*.py", [root], keywords=["test_two"], index_path=index_path, stats=stats
+            )
+
+            # ASSERT — the stale index entry is not trusted
+            self.assertEqual([t.id() for t in suite], ["test_idx_inherits.Case.test_two"])
+            self.assertEqual(stats["imported"], 1)
+
+    def test___iter_test_files___invalid_module_name____skipped_like_unittest(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            write_test_module(root, "test_idx_ok")
+            (root / "test-idx-dash.py").write_text("raise SystemExit\n", encoding="utf-8")
+
+            found = [name for _, name in run_tests.iter_test_files(root, "test*.py")]
+
+            self.assertEqual(found, ["test_idx_ok"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)